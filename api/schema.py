@@ -1,18 +1,32 @@
 from precip.models import Raingage
+from django_filters import FilterSet
 from graphene import ObjectType, Node, Schema
 from graphene_django.fields import DjangoConnectionField
 from graphene_django.filter import DjangoFilterConnectionField
 from graphene_django.types import DjangoObjectType
 
+class RaingageFilter(FilterSet):
+
+    class Meta:
+        model = Raingage
+        fields = ['name', 'code']
+
+    @property
+    def qs(self):
+        # Most queries (e.g. the map) ask for every raingage, so skip form
+        # validation and filtering when no filter arguments were given.
+        if not self.data:
+            return self.queryset.all()
+        return super().qs
+
 class RaingageNode(DjangoObjectType):
 
     class Meta:
         model = Raingage
         interfaces = (Node,)
-        filter_fields = ['name', 'code']
 
 class Query(ObjectType):
     raingage = Node.Field(RaingageNode)
-    raingages = DjangoFilterConnectionField(RaingageNode)
+    raingages = DjangoFilterConnectionField(RaingageNode, filterset_class=RaingageFilter)
 
 schema = Schema(query=Query)
\ No newline at end of file
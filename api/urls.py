@@ -1,8 +1,8 @@
 from django.urls import path, include
-from graphene_django.views import GraphQLView
+from .views import CachedGraphQLView
 
 app_name = 'api'
 
 urlpatterns = [
-    path('graphql', GraphQLView.as_view(graphiql=True)),
+    path('graphql', CachedGraphQLView.as_view(graphiql=True)),
 ]
\ No newline at end of file
@@ -1,3 +1,39 @@
-from django.shortcuts import render
+import hashlib
 
-# Create your views here.
+from django.core.cache import cache
+from graphene_django.views import GraphQLView
+
+# Seconds to keep the result of a GraphQL GET query in the cache.
+GRAPHQL_CACHE_TIMEOUT = 60
+
+
+class CachedGraphQLView(GraphQLView):
+
+    # Set once the query has run; only results without errors are cached.
+    cacheable = False
+
+    def execute_graphql_request(self, *args, **kwargs):
+        execution_result = super().execute_graphql_request(*args, **kwargs)
+        self.cacheable = bool(execution_result) and not execution_result.errors
+        return execution_result
+
+    def get_response(self, request, data, show_graphiql=False):
+        # Only the JSON results of GET queries are cached; the GraphiQL page
+        # and POST requests always execute. dispatch still runs for every
+        # request, so ensure_csrf_cookie keeps setting the CSRF cookie.
+        # Raingages can change through the admin or the import scripts, so
+        # a cached result may be up to GRAPHQL_CACHE_TIMEOUT seconds stale.
+        if request.method != 'GET' or show_graphiql:
+            return super().get_response(request, data, show_graphiql)
+
+        path = request.get_full_path().encode('utf-8')
+        key = 'graphql:{}'.format(hashlib.sha1(path).hexdigest())
+        response = cache.get(key)
+
+        if response is None:
+            response = super().get_response(request, data, show_graphiql)
+
+            if self.cacheable:
+                cache.set(key, response, GRAPHQL_CACHE_TIMEOUT)
+
+        return response
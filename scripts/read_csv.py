@@ -0,0 +1,17 @@
+import os
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Number of precip events to hold in memory before writing them to the db.
+BATCH_SIZE = 5000
+
+
+def read_rows(filename, skip_header=True):
+    # Lazily yield the '|' delimited values of each line of a data file in
+    # the scripts directory.
+    with open(os.path.join(BASE_DIR, 'scripts', filename), 'r') as f:
+        if skip_header:
+            next(f, None)
+
+        for line in f:
+            yield line.strip().split('|')
@@ -1,8 +1,7 @@
-import os
+from django.db import transaction
+from .read_csv import BATCH_SIZE, read_rows
 from precip.models import Raingage, PrecipEvent
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
 station_name_map = [
     {"id": "white", "name": "Whitehouse"},
     {"id": "watre", "name": "Water Retention"},
@@ -47,62 +46,50 @@ station_name_map = [
     {"id": "131", "name": "Encl. No. 131"},
 ]
 
+# Station id -> name lookup, built once instead of scanning the list per row.
+station_names = {s['id']: s['name'] for s in station_name_map}
 
-def precip_values(values):
-    output = []
-
-    for k, v in enumerate(values):
-        if v in ['-9999', '']:
-            output.append(None)
-        else:
-            output.append(float(int(v) / 100.00))
-
-    return output
 
+MISSING_VALUES = frozenset(['-9999', ''])
 
-def find_station_name(name):
-    station_name = None
 
-    for s in station_name_map:
-        if s['id'] == name:
-            station_name = s['name']
-
-    return station_name
+def precip_values(values):
+    # Values are hundredths of an inch; -9999 or blank means no reading.
+    return [None if v in MISSING_VALUES else int(v) / 100.0 for v in values]
 
 
+@transaction.atomic
 def run():
     print("Loading precip data.")
     PrecipEvent.objects.all().delete()
     events = []
+
+    # Index the raingages by name once instead of querying for every row.
+    raingages = {rg.name: rg for rg in Raingage.objects.all()}
+
     # STATION|YEAR|JAN|FEB|MAR|APR|MAY|JUN|JUL|AUG|SEP|OCT|NOV|DEC|||
-    i = 0
-    with open(BASE_DIR + '/scripts/srer_precip.csv', 'r') as f:
-        for line in f.readlines():
-            if i > 0:
-                values = line.strip().split('|')
-                station = values[0].lower()
-                year = values[1]
-                station_name = None
-
-                station_id_list = list(i['id'] for i in station_name_map)
-                if station in station in station_id_list:
-                    station_name = find_station_name(station)
-                else:
-                    station_name = station
-
-                try:
-                    raingage = Raingage.objects.get(name=station_name)
-                except Exception:
-                    print("Rain station not found: %s, %s, %s" % (station, station_name, year))
-
-                precip_vals = precip_values(values[2:])
-
-                for k, v in enumerate(precip_vals):
-                    # month = PrecipEvent.MONTH_CHOICES[k][0]
-                    event = PrecipEvent(raingage=raingage, year=year, month=k, precip=v)
-                    events.append(event)
-                    # event.save()
-            i += 1
+    for values in read_rows('srer_precip.csv'):
+        station = values[0].lower()
+        year = values[1]
+        station_name = station_names.get(station, station)
+
+        raingage = raingages.get(station_name)
+
+        if raingage is None:
+            print("Rain station not found: %s, %s, %s" % (station, station_name, year))
+            continue
+
+        precip_vals = precip_values(values[2:])
+
+        for k, v in enumerate(precip_vals):
+            # month = PrecipEvent.MONTH_CHOICES[k][0]
+            event = PrecipEvent(raingage=raingage, year=year, month=k, precip=v)
+            events.append(event)
+            # event.save()
+
+        if len(events) >= BATCH_SIZE:
+            PrecipEvent.objects.bulk_create(events)
+            events = []
 
     if events:
         PrecipEvent.objects.bulk_create(events)